@@ -1,4 +1,212 @@
 import tkinter as tk
+from array import array
+from itertools import accumulate
+
+# Vertex fill colors; the length is a power of two so a color index can wrap around with a mask
+HEX_COLORS = ("#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#00FFFF", "#FF00FF", "#FF8000", "#8000FF")
+
+
+def greedy_color(indptr, indices, order, colors):
+    """
+    Greedily color vertices of a graph given in CSR form.
+
+    The neighbors of vertex v are indices[indptr[v]:indptr[v + 1]]. Vertices are visited in the given
+    order and each one receives the smallest color not used by an already colored neighbor.
+
+    Args:
+        indptr (sequence): Offsets into indices, of length n + 1.
+        indices (sequence): Concatenated neighbor indices of all vertices.
+        order (iterable): The vertex indices in the order they should be colored.
+        colors (list): Output list of length n. Entries that are not None are treated as precolored.
+
+    """
+    for v in order:
+        # Collect the colors of neighboring vertices as bits of a single integer
+        used = 0
+        for k in range(indptr[v], indptr[v + 1]):
+            c = colors[indices[k]]
+            if c is not None:
+                used |= 1 << c
+
+        # The smallest available color is the lowest zero bit
+        colors[v] = (~used & (used + 1)).bit_length() - 1
+
+
+def brooks_color(indptr, indices):
+    """
+    Color a graph given in CSR form with at most max-degree colors, following Brooks' theorem.
+
+    Every connected component is colored with at most as many colors as its maximum degree, except
+    for complete graphs and odd cycles, which need one color more. The construction follows Lovasz's
+    proof of the theorem: vertices are colored greedily in an order in which every vertex but the last
+    still has an uncolored neighbor, so the greedy bound of degree + 1 colors drops to degree colors.
+
+    Args:
+        indptr (sequence): Offsets into indices, of length n + 1.
+        indices (sequence): Concatenated neighbor indices of all vertices, without duplicates.
+
+    Returns:
+        list: The color of every vertex, numbered from 0.
+    """
+    n = len(indptr) - 1
+    colors = [None] * n
+    seen = bytearray(n)
+    # Scratch visited flags for the searches inside a component; every search clears what it marked
+    scratch = bytearray(n)
+    for root in range(n):
+        if not seen[root]:
+            component = _bfs(indptr, indices, root, seen)
+            _brooks_color_component(indptr, indices, component, colors, scratch)
+    return colors
+
+
+def _brooks_color_component(indptr, indices, component, colors, scratch):
+    """
+    Color one connected component with at most as many colors as its maximum degree, when possible.
+
+    Args:
+        indptr (sequence): Offsets into indices, of length n + 1.
+        indices (sequence): Concatenated neighbor indices of all vertices.
+        component (list): The vertices of the component, in BFS order.
+        colors (list): Output list of vertex colors.
+        scratch (bytearray): All-zero visited flags of length n, left all zero on return.
+    """
+    delta = max(indptr[v + 1] - indptr[v] for v in component)
+
+    # A vertex of degree below delta can be colored last: coloring the BFS tree rooted at it
+    # from the leaves up leaves every other vertex with its uncolored parent
+    root = next((v for v in component if indptr[v + 1] - indptr[v] < delta), None)
+    if root is not None:
+        order = _bfs(indptr, indices, root, scratch)
+        _clear(scratch, order)
+        greedy_color(indptr, indices, reversed(order), colors)
+        return
+
+    # Complete graphs and cycles; odd cycles and complete graphs need delta + 1 colors
+    if delta <= 2 or len(component) == delta + 1:
+        greedy_color(indptr, indices, component, colors)
+        return
+
+    # A cut vertex has degree below delta inside each part it separates, so each part together with
+    # it can be colored with delta colors, after which the colors are permuted to agree on it
+    cut = _find_cut_vertex(indptr, indices, component[0])
+    if cut is not None:
+        cut_neighbors = indices[indptr[cut]:indptr[cut + 1]]
+        scratch[cut] = 1
+        for start in cut_neighbors:
+            if scratch[start]:
+                continue
+            part = _bfs(indptr, indices, start, scratch)
+            greedy_color(indptr, indices, reversed(part), colors)
+            part_set = set(part)
+            used = 0
+            for u in cut_neighbors:
+                if u in part_set:
+                    used |= 1 << colors[u]
+            free = (~used & (used + 1)).bit_length() - 1
+            for u in part:
+                if colors[u] == free:
+                    colors[u] = 0
+                elif colors[u] == 0:
+                    colors[u] = free
+        _clear(scratch, component)
+        colors[cut] = 0
+        return
+
+    # 2-connected: find v with non-adjacent neighbors u and w such that removing u and w keeps the
+    # graph connected, color u and w alike, then color the BFS tree rooted at v from the leaves up
+    adjacent = {v: set(indices[indptr[v]:indptr[v + 1]]) for v in component}
+    for v in component:
+        for u in adjacent[v]:
+            for w in adjacent[v]:
+                if u >= w or w in adjacent[u]:
+                    continue
+                scratch[u] = scratch[w] = 1
+                order = _bfs(indptr, indices, v, scratch)
+                _clear(scratch, order)
+                scratch[u] = scratch[w] = 0
+                if len(order) == len(component) - 2:
+                    colors[u] = colors[w] = 0
+                    greedy_color(indptr, indices, reversed(order), colors)
+                    return
+
+    # Brooks' lemma guarantees a triple above; never leave the component uncolored regardless
+    greedy_color(indptr, indices, component, colors)
+
+
+def _bfs(indptr, indices, root, seen):
+    """
+    Return the vertices reachable from root in BFS order, skipping and marking vertices in seen.
+
+    Args:
+        indptr (sequence): Offsets into indices, of length n + 1.
+        indices (sequence): Concatenated neighbor indices of all vertices.
+        root (int): The vertex to start from.
+        seen (bytearray): Visited flags, updated in place. Vertices flagged beforehand are not entered.
+
+    Returns:
+        list: The visited vertices, starting with root.
+    """
+    seen[root] = 1
+    order = [root]
+    for v in order:
+        for k in range(indptr[v], indptr[v + 1]):
+            u = indices[k]
+            if not seen[u]:
+                seen[u] = 1
+                order.append(u)
+    return order
+
+
+def _clear(flags, vertices):
+    """
+    Reset the flags of the given vertices to zero.
+
+    Args:
+        flags (bytearray): The flags to reset, updated in place.
+        vertices (iterable): The vertex indices whose flags were set.
+    """
+    for v in vertices:
+        flags[v] = 0
+
+
+def _find_cut_vertex(indptr, indices, root):
+    """
+    Find a cut vertex in the connected component containing root.
+
+    Uses an iterative depth-first search that tracks the lowest depth reachable from every subtree.
+
+    Args:
+        indptr (sequence): Offsets into indices, of length n + 1.
+        indices (sequence): Concatenated neighbor indices of all vertices.
+        root (int): A vertex of the component.
+
+    Returns:
+        int or None: A cut vertex, or None if the component is 2-connected.
+    """
+    depth = {root: 0}
+    low = {root: 0}
+    root_children = 0
+    stack = [(root, None, iter(indices[indptr[root]:indptr[root + 1]]))]
+    while stack:
+        v, parent, unvisited = stack[-1]
+        for u in unvisited:
+            if u not in depth:
+                depth[u] = low[u] = depth[v] + 1
+                stack.append((u, v, iter(indices[indptr[u]:indptr[u + 1]])))
+                if v == root:
+                    root_children += 1
+                break
+            if u != parent:
+                low[v] = min(low[v], depth[u])
+        else:
+            stack.pop()
+            if parent is not None:
+                low[parent] = min(low[parent], low[v])
+                if parent != root and low[v] >= depth[parent]:
+                    return parent
+    return root if root_children > 1 else None
+
 
 class GraphColoringApp(tk.Tk):
     """
@@ -17,6 +225,8 @@ class GraphColoringApp(tk.Tk):
         edges (list): List of tuples representing the edges between connected vertices.
         selected_vertex (Vertex or None): The currently selected vertex during edge connection.
         connect_mode (bool): Flag to indicate whether the connect mode is active or not.
+        _csr (tuple or None): Cached (indptr, indices) adjacency, or None when the edges have changed.
+        _grid (dict): Vertices bucketed by 20x20 pixel cell of the canvas, for click hit-testing.
     """
 
     def __init__(self):
@@ -40,6 +250,8 @@ class GraphColoringApp(tk.Tk):
         self.edges = []
         self.selected_vertex = None
         self.connect_mode = False
+        self._csr = None
+        self._grid = {}
 
     def clear_graph(self):
         """
@@ -50,6 +262,8 @@ class GraphColoringApp(tk.Tk):
         self.edges = []
         self.selected_vertex = None
         self.connect_mode = False
+        self._csr = None
+        self._grid = {}
         self.canvas.bind("<Button-1>", self.add_vertex)
 
     def color_graph(self):
@@ -63,43 +277,32 @@ class GraphColoringApp(tk.Tk):
         if len(self.vertices) == 0:
             return
 
-        # Clear previous colors
-        for vertex in self.vertices:
-            vertex.color = None
-
-        # Find the vertex with the maximum degree
-        max_degree_vertex = max(self.vertices, key=lambda v: len(v.connected_vertices))
-
-        # Color the vertex with the maximum degree using color 0
-        max_degree_vertex.color = 0
+        colors = brooks_color(*self._flatten_csr())
 
-        # Create a list to keep track of available colors
-        available_colors = [True]
-
-        # Color the remaining vertices
+        # Store the colors back on the vertices and recolor their existing canvas items
         for vertex in self.vertices:
-            if vertex == max_degree_vertex:
-                continue
+            vertex.color = colors[vertex.index]
+            self.canvas.itemconfig(vertex.oval_id, fill=self.color_to_hex(vertex.color))
+            self.canvas.itemconfig(vertex.text_id, text=str(vertex.color), fill="white")
 
-            # Initialize the list of available colors for the current vertex
-            available_colors = [True] * (len(self.vertices) + 1)
-
-            # Mark the colors of neighboring vertices as unavailable
-            for neighbor in vertex.connected_vertices:
-                if neighbor.color is not None:
-                    available_colors[neighbor.color] = False
-
-            # Find the smallest available color for the current vertex
-            color = next(i for i, is_available in enumerate(available_colors) if is_available)
+    def _flatten_csr(self):
+        """
+        Return the adjacency of the graph in CSR form.
 
-            # Assign the color to the current vertex
-            vertex.color = color
+        The arrays are built from the connected vertices of every vertex, cached, and only rebuilt
+        after an edge or vertex has been added.
 
-        # Visualization code
-        for vertex in self.vertices:
-            x, y = vertex.position
-            self.canvas.create_oval(x - 10, y - 10, x + 10, y + 10, fill=self.color_to_hex(vertex.color))
-            self.canvas.create_text(x, y, text=str(vertex.color), fill="white")
+        Returns:
+            tuple: The (indptr, indices) arrays, where the neighbors of vertex v are
+            indices[indptr[v]:indptr[v + 1]].
+        """
+        if self._csr is None:
+            indices = array('i')
+            for vertex in self.vertices:
+                indices.extend(sorted(neighbor.index for neighbor in vertex.connected_vertices))
+            indptr = array('i', accumulate((len(vertex.connected_vertices) for vertex in self.vertices), initial=0))
+            self._csr = (indptr, indices)
+        return self._csr
 
     def connect_vertices(self):
         """
@@ -125,22 +328,47 @@ class GraphColoringApp(tk.Tk):
             event (tk.Event): The mouse click event containing the coordinates of the click.
 
         """
-        x, y = event.x, event.y
-        for vertex in self.vertices:
-            vx, vy = vertex.position
-            if abs(x - vx) <= 10 and abs(y - vy) <= 10:
-                if self.selected_vertex is None:
-                    self.selected_vertex = vertex
-                    return
-                if self.selected_vertex != vertex:
-                    self.edges.append((self.selected_vertex, vertex))
-                    self.canvas.create_line(self.selected_vertex.position, vertex.position)
-                    self.selected_vertex.connected_vertices.append(vertex)
-                    vertex.connected_vertices.append(self.selected_vertex)
-                    self.selected_vertex = None
-                    return
+        for vertex in self._vertices_at(event.x, event.y):
+            if self.selected_vertex is None:
+                self.selected_vertex = vertex
+                return
+            if vertex in self.selected_vertex.connected_vertices:
+                # The vertices are already connected, so there is no new edge to add
+                self.selected_vertex = None
+                return
+            if self.selected_vertex != vertex:
+                self.edges.append((self.selected_vertex, vertex))
+                line_id = self.canvas.create_line(self.selected_vertex.position, vertex.position)
+                self.canvas.tag_lower(line_id)
+                self.selected_vertex.connected_vertices.add(vertex)
+                vertex.connected_vertices.add(self.selected_vertex)
+                self._csr = None
+                self.selected_vertex = None
+                return
         self.selected_vertex = None
 
+    def _vertices_at(self, x, y):
+        """
+        Find the vertices whose circle contains a point.
+
+        Only the grid cells that overlap the 21x21 pixel box around the point are scanned.
+
+        Args:
+            x (int): The x coordinate of the point.
+            y (int): The y coordinate of the point.
+
+        Returns:
+            list: The hit vertices, in the order they were added.
+        """
+        hits = [
+            vertex
+            for cx in range((x - 10) // 20, (x + 10) // 20 + 1)
+            for cy in range((y - 10) // 20, (y + 10) // 20 + 1)
+            for vertex in self._grid.get((cx, cy), ())
+            if abs(x - vertex.position[0]) <= 10 and abs(y - vertex.position[1]) <= 10
+        ]
+        return sorted(hits, key=lambda v: v.index)
+
     def add_vertex(self, event):
         """
         Add a vertex to the graph.
@@ -155,8 +383,10 @@ class GraphColoringApp(tk.Tk):
         x, y = event.x, event.y
         vertex = Vertex((x, y), len(self.vertices))
         self.vertices.append(vertex)
-        self.canvas.create_oval(x - 10, y - 10, x + 10, y + 10, fill="white")
-        self.canvas.create_text(x, y, text=str(vertex.index))
+        self._grid.setdefault((x // 20, y // 20), []).append(vertex)
+        self._csr = None
+        vertex.oval_id = self.canvas.create_oval(x - 10, y - 10, x + 10, y + 10, fill="white")
+        vertex.text_id = self.canvas.create_text(x, y, text=str(vertex.index))
 
     @staticmethod
     def color_to_hex(color):
@@ -164,8 +394,8 @@ class GraphColoringApp(tk.Tk):
         Convert color index to hexadecimal color code.
 
         This static method converts the color index to a hexadecimal color code.
-        It uses a predefined list of color codes and wraps around when the index exceeds
-        the length of the list.
+        It uses the predefined HEX_COLORS table and wraps around when the index exceeds
+        the length of the table.
 
         Args:
             color (int): The color index.
@@ -174,8 +404,7 @@ class GraphColoringApp(tk.Tk):
             str: The hexadecimal color code.
 
         """
-        hex_values = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#00FFFF", "#FF00FF"]
-        return hex_values[color % len(hex_values)]
+        return HEX_COLORS[color & (len(HEX_COLORS) - 1)]
 
     def display_graph_info(self):
         """
@@ -226,17 +455,21 @@ class Vertex:
     """
     Class representing a graph vertex.
 
-    Each vertex has a position on the canvas, a list of connected vertices,
+    Each vertex has a position on the canvas, a set of connected vertices,
     a color assignment, and an index.
 
     Attributes:
         position (tuple): The position (x, y) of the vertex on the canvas.
-        connected_vertices (list): List of connected Vertex objects.
+        connected_vertices (set): Set of connected Vertex objects.
         color (int or None): The color assigned to the vertex.
         index (int): The index of the vertex in the graph.
+        oval_id (int or None): The canvas item id of the circle drawn for the vertex.
+        text_id (int or None): The canvas item id of the label drawn inside the circle.
 
     """
 
+    __slots__ = ("position", "connected_vertices", "color", "index", "oval_id", "text_id")
+
     def __init__(self, position, index):
         """
         Initialize the Vertex class.
@@ -247,9 +480,11 @@ class Vertex:
 
         """
         self.position = position
-        self.connected_vertices = []
+        self.connected_vertices = set()
         self.color = None
         self.index = index
+        self.oval_id = None
+        self.text_id = None
 
     def __repr__(self):
         """
@@ -0,0 +1,106 @@
+import unittest
+from itertools import combinations
+
+from Brooks import brooks_color
+
+
+def to_csr(n, edges):
+    """
+    Convert an edge list into the (indptr, indices) arrays expected by brooks_color.
+
+    Args:
+        n (int): The number of vertices.
+        edges (list): Pairs of vertex indices.
+
+    Returns:
+        tuple: The (indptr, indices) lists.
+    """
+    neighbors = [[] for _ in range(n)]
+    for a, b in edges:
+        neighbors[a].append(b)
+        neighbors[b].append(a)
+    indptr = [0]
+    indices = []
+    for vertex_neighbors in neighbors:
+        indices.extend(vertex_neighbors)
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+def k5_minus_edge(offset):
+    """
+    Return the edges of K5 without the edge between its first two vertices.
+
+    Args:
+        offset (int): The index of the first vertex.
+
+    Returns:
+        list: The edges of the graph.
+    """
+    return [(offset + a, offset + b) for a, b in combinations(range(5), 2) if (a, b) != (0, 1)]
+
+
+class BrooksColorTest(unittest.TestCase):
+    def assert_brooks_coloring(self, n, edges, exceptional=False):
+        """
+        Color the graph and check that the coloring is proper and within Brooks' bound.
+
+        Args:
+            n (int): The number of vertices.
+            edges (list): Pairs of vertex indices.
+            exceptional (bool): Whether the graph is a complete graph or an odd cycle,
+                which may use one color more than its maximum degree.
+
+        Returns:
+            list: The colors of the vertices.
+        """
+        colors = brooks_color(*to_csr(n, edges))
+        for a, b in edges:
+            self.assertNotEqual(colors[a], colors[b], f"edge ({a}, {b}) is monochromatic")
+        degrees = [0] * n
+        for a, b in edges:
+            degrees[a] += 1
+            degrees[b] += 1
+        delta = max(degrees)
+        self.assertLess(max(colors), delta + 1 if exceptional else delta)
+        return colors
+
+    def test_path(self):
+        self.assert_brooks_coloring(5, [(i, i + 1) for i in range(4)])
+
+    def test_tree(self):
+        self.assert_brooks_coloring(8, [(0, 1), (0, 2), (0, 3), (1, 4), (1, 5), (3, 6), (6, 7)])
+
+    def test_even_cycle(self):
+        self.assert_brooks_coloring(6, [(i, (i + 1) % 6) for i in range(6)])
+
+    def test_odd_cycle(self):
+        colors = self.assert_brooks_coloring(7, [(i, (i + 1) % 7) for i in range(7)], exceptional=True)
+        self.assertEqual(max(colors), 2)
+
+    def test_complete_graph(self):
+        colors = self.assert_brooks_coloring(5, list(combinations(range(5), 2)), exceptional=True)
+        self.assertEqual(max(colors), 4)
+
+    def test_regular_graph_with_cut_vertex(self):
+        # Two copies of K5 minus an edge, whose four degree-3 vertices all join vertex 10
+        edges = k5_minus_edge(0) + k5_minus_edge(5) + [(0, 10), (1, 10), (5, 10), (6, 10)]
+        self.assert_brooks_coloring(11, edges)
+
+    def test_petersen_graph(self):
+        edges = ([(i, (i + 1) % 5) for i in range(5)]
+                 + [(5 + i, 5 + (i + 2) % 5) for i in range(5)]
+                 + [(i, i + 5) for i in range(5)])
+        self.assert_brooks_coloring(10, edges)
+
+    def test_complete_bipartite_graph(self):
+        self.assert_brooks_coloring(6, [(a, b) for a in range(3) for b in range(3, 6)])
+
+    def test_disconnected_graph(self):
+        edges = [(i, (i + 1) % 4) for i in range(4)] + [(4, 5)]
+        colors = self.assert_brooks_coloring(7, edges)
+        self.assertEqual(colors[6], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()